@@ -1,26 +1,87 @@
 import PyInstaller.__main__
+import platform
+import shutil
+import subprocess
 import sys
 from pathlib import Path
 
+DIST_DIR = Path('dist')
+APP_NAME = 'timetrack'
+ARM64_MACHINES = ('arm64', 'aarch64')
+
+
+def check_interpreter():
+    """Refuse to build from anything but a 64-bit arm64 Python.
+
+    A universal2 interpreter makes PyInstaller collect universal2 slices of
+    the dependencies, which bloats the bundle and slows down startup. Build
+    from a venv created with an arm64-only python3 (python3 -m venv .venv).
+    macOS reports the architecture as arm64, Linux as aarch64.
+    """
+    if platform.machine() not in ARM64_MACHINES or sys.maxsize <= 2**32:
+        raise SystemExit(f"build.py must run on a 64-bit arm64 Python, not {platform.machine()}")
+
+
+def check_single_arch(executable):
+    """Fail the build if lipo reports more than one architecture."""
+    if sys.platform != 'darwin':
+        return
+    info = subprocess.run(['lipo', '-info', str(executable)], capture_output=True, text=True, check=True)
+    if not info.stdout.strip().startswith('Non-fat file'):
+        raise SystemExit(f"Expected a single-arch arm64 binary: {info.stdout.strip()}")
+
+
 def build():
-    PyInstaller.__main__.run([
+    check_interpreter()
+    args = [
         'timetrack/cli.py',
-        '--name=timetrack',
-        '--onefile',
-        # Optimeringar för snabbare uppstart
+        f'--name={APP_NAME}',
+        # --onedir i stället för --onefile: med --onefile måste bootloadern
+        # packa upp hela arkivet till en temp-katalog vid varje start
+        '--onedir',
+        # Lägg .pyc-filerna direkt i katalogen i stället för i ett PYZ-arkiv
+        # som måste packas upp vid start (kräver --onedir)
+        '--noarchive',
+        # Optimeringar för snabbare uppstart. json, pathlib och datetime är
+        # stdlib och hittas automatiskt av PyInstaller
         '--hidden-import=click',
-        '--hidden-import=json',
-        '--hidden-import=pathlib',
-        '--hidden-import=datetime',
+        '--hidden-import=orjson',
         # Viktiga flaggor för macOS
         '--noconsole',  # Minskar uppstartstiden på macOS
         '--noconfirm',
         '--clean',
         # Avaktivera komprimering för snabbare uppstart
         '--noupx',
-        # macOS-specifika optimeringar
-        '--target-arch=arm64',  # eller 'arm64' för M1/M2
-])
+        # Moduler som CLI:t aldrig använder, håller --onedir-trädet litet
+        '--exclude-module=tkinter',
+        '--exclude-module=unittest',
+        '--exclude-module=pydoc',
+    ]
+    if sys.platform == 'darwin':
+        # macOS-specifik optimering, PyInstaller stöder --target-arch bara där
+        args.append('--target-arch=arm64')
+    if sys.platform != 'win32':
+        # Ta bort debugsymboler, mindre binär att mappa in vid start
+        args.append('--strip')
+    PyInstaller.__main__.run(args)
+    check_single_arch(DIST_DIR / APP_NAME / APP_NAME)
+    package()
+
+
+def package():
+    """Pack the dist/timetrack/ folder for distribution.
+
+    macOS gets the .app bundle produced by PyInstaller, other platforms a
+    tarball. Either way the executable is dist/timetrack/timetrack, which is
+    what should be symlinked into /usr/local/bin.
+    """
+    app_dir = DIST_DIR / APP_NAME
+    if sys.platform == 'darwin' and (DIST_DIR / f'{APP_NAME}.app').exists():
+        return DIST_DIR / f'{APP_NAME}.app'
+    archive = shutil.make_archive(str(DIST_DIR / f'{APP_NAME}-{sys.platform}'), 'gztar',
+                                  root_dir=DIST_DIR, base_dir=app_dir.name)
+    return Path(archive)
+
 
 if __name__ == "__main__":
     build()
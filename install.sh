@@ -4,8 +4,14 @@
 GREEN='\033[0;32m'
 NC='\033[0m' # No Color
 
-# Build and install the package globally
-poetry build
-pipx install --force dist/*.whl
+if [ "$1" == "--binary" ]; then
+    # Build the standalone --onedir bundle and link its executable into PATH
+    poetry run python build.py
+    sudo ln -sf "$(pwd)/dist/timetrack/timetrack" /usr/local/bin/timetrack
+else
+    # Build and install the package globally
+    poetry build
+    pipx install --force dist/*.whl
+fi
 
-echo -e "${GREEN}Installation complete!${NC}"
\ No newline at end of file
+echo -e "${GREEN}Installation complete!${NC}"
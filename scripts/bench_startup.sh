@@ -0,0 +1,25 @@
+#!/bin/bash
+# Cold-start benchmark for the PyInstaller build. Run after `python build.py`.
+# Fails if the median start time of `timetrack --help` exceeds the budget.
+
+BINARY=${BINARY:-dist/timetrack/timetrack}
+BUDGET_MS=${BUDGET_MS:-300}
+RESULTS=$(mktemp)
+
+# Drop the file cache before every run so each one is a real cold start
+if [ "$(uname)" == "Darwin" ]; then
+    PREPARE='sudo purge'
+else
+    PREPARE="sync; echo 3 | sudo tee /proc/sys/vm/drop_caches > /dev/null"
+fi
+
+hyperfine --warmup 3 --prepare "$PREPARE" --export-json "$RESULTS" "$BINARY --help" || exit 1
+
+MEDIAN_MS=$(python3 -c "import json, sys; print(round(json.load(open(sys.argv[1]))['results'][0]['median'] * 1000))" "$RESULTS")
+rm -f "$RESULTS"
+
+if [ "$MEDIAN_MS" -gt "$BUDGET_MS" ]; then
+    echo "Median cold start ${MEDIAN_MS}ms exceeds the ${BUDGET_MS}ms budget"
+    exit 1
+fi
+echo "Median cold start ${MEDIAN_MS}ms (budget ${BUDGET_MS}ms)"
@@ -1,7 +1,23 @@
+import datetime
 import pytest
 from pathlib import Path
+from click.testing import CliRunner
 from timetrack.cli import TimeTracker
 
+def make_session(id, main, sub, desc, start, hours):
+    """Build a session dict shaped like the ones TimeTracker keeps in memory."""
+    return {
+        'id': id,
+        'main_category': main,
+        'subcategory': sub,
+        'description': desc,
+        'start_time': start,
+        'end_time': start + datetime.timedelta(hours=hours),
+        'duration': str(datetime.timedelta(hours=hours)),
+        'duration_hours': hours,
+        'week': start.isocalendar()[1]
+    }
+
 @pytest.fixture(scope="session")
 def test_data_dir(tmp_path_factory):
     return tmp_path_factory.mktemp("data")
@@ -9,3 +25,53 @@ def test_data_dir(tmp_path_factory):
 @pytest.fixture
 def mock_data_file(test_data_dir):
     return test_data_dir / "test_timetrack_data.json"
+
+@pytest.fixture(scope="session")
+def base_tracker(test_data_dir):
+    # Build one TimeTracker for the whole run; HOME points at the session dir so
+    # the categories file is created there instead of in the real home directory
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("HOME", str(test_data_dir))
+        tracker = TimeTracker()
+    tracker.data_file = test_data_dir / "session_data.json"
+    tracker.sessions_file = test_data_dir / "session_sessions.jsonl"
+    return tracker
+
+@pytest.fixture
+def tracker(base_tracker, tmp_path):
+    # Reuse the session tracker with empty state and its own files under
+    # tmp_path, which pytest cleans up, so no unlink needed
+    base_tracker.reset()
+    base_tracker.data_file = tmp_path / "test_timetrack_data.json"
+    base_tracker.sessions_file = tmp_path / "test_timetrack_sessions.jsonl"
+    return base_tracker
+
+@pytest.fixture
+def no_save_tracker(tracker, monkeypatch):
+    # For tests that only assert in-memory state: skip writing the data file
+    monkeypatch.setattr(tracker, "_save_data", lambda: None)
+    return tracker
+
+@pytest.fixture(scope="session")
+def runner():
+    # Every invoke() gets its own isolated streams, so one runner is enough
+    return CliRunner()
+
+@pytest.fixture
+def iso_fs(runner, monkeypatch):
+    # Run in a fresh temp dir and treat it as HOME, so TimeTracker() and cli
+    # read and write their data files there
+    with runner.isolated_filesystem() as fs:
+        monkeypatch.setenv("HOME", fs)
+        yield Path(fs)
+
+def pytest_collection_modifyitems(config, items):
+    # CLI tests run in-process through CliRunner; spawning the timetrack
+    # binary per test is far slower, so refuse test modules that do
+    paths = {item.path for item in items}
+    offenders = sorted(str(path) for path in paths if "subprocess." in path.read_text())
+    if offenders:
+        raise pytest.UsageError(
+            "Tests must invoke the CLI with click.testing.CliRunner, not subprocess: "
+            + ", ".join(offenders)
+        )
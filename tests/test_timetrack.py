@@ -2,52 +2,31 @@ import pytest
 from pathlib import Path
 import json
 import click
-from click.testing import CliRunner
 from timetrack.cli import TimeTracker, cli
+from conftest import make_session
 import datetime
 
-@pytest.fixture
-def tracker():
-    tracker = TimeTracker()
-    tracker.data_file = Path("test_timetrack_data.json")
-    # Clear any existing data
-    tracker.active_timers = {}
-    tracker.sessions = []
-    return tracker
-
-@pytest.fixture
-def runner():
-    return CliRunner()
-
-@pytest.fixture(autouse=True)
-def cleanup(tracker):
-    if tracker.data_file.exists():
-        tracker.data_file.unlink()
-    yield
-    if tracker.data_file.exists():
-        tracker.data_file.unlink()
-
-def test_start_timer(tracker):
-    tracker.start_timer("Product dev", "Software development", "Test task")
-    assert len(tracker.active_timers) == 1
+def test_start_timer(no_save_tracker):
+    no_save_tracker.start_timer("Product dev", "Software development", "Test task")
+    assert len(no_save_tracker.active_timers) == 1
     timer_key = "Product dev - Software development"
-    assert timer_key in tracker.active_timers
-    assert tracker.active_timers[timer_key]["description"] == "Test task"
+    assert timer_key in no_save_tracker.active_timers
+    assert no_save_tracker.active_timers[timer_key]["description"] == "Test task"
 
-def test_end_timer(tracker):
+def test_end_timer(no_save_tracker):
     # Clear any existing sessions
-    tracker.sessions = []
-    tracker.start_timer("Product dev", "Software development", "Test task")
-    tracker.end_timer("Product dev", "Software development")
-    assert len(tracker.active_timers) == 0
-    assert len(tracker.sessions) == 1
+    no_save_tracker.sessions = []
+    no_save_tracker.start_timer("Product dev", "Software development", "Test task")
+    no_save_tracker.end_timer("Product dev", "Software development")
+    assert len(no_save_tracker.active_timers) == 0
+    assert len(no_save_tracker.sessions) == 1
 
-def test_cli_start_command(runner):
+def test_cli_start_command(runner, iso_fs):
     result = runner.invoke(cli, ["start", "Product dev", "Software development", "-d", "Test task"])
     assert result.exit_code == 0
     assert "Started timer" in result.output
 
-def test_cli_end_command(runner):
+def test_cli_end_command(runner, iso_fs):
     # First start a timer
     runner.invoke(cli, ["start", "Product dev", "Software development"])
     # Then end it
@@ -55,70 +34,150 @@ def test_cli_end_command(runner):
     assert result.exit_code == 0
     assert "Ended timer" in result.output
 
-def test_cli_status_command(runner):
+def test_cli_start_saves_once_when_stopping_running_timer(runner, iso_fs, monkeypatch):
+    runner.invoke(cli, ["start", "Product dev", "Software development"])
+    writes = []
+    write_bytes = Path.write_bytes
+    monkeypatch.setattr(Path, "write_bytes", lambda path, data: writes.append(path.name) or write_bytes(path, data))
+
+    result = runner.invoke(cli, ["start", "Sales", "Direct sales"], input="y\n")
+    assert result.exit_code == 0
+    assert writes == [".timetrack_data.json"]
+    tracker = TimeTracker()
+    assert list(tracker.active_timers) == ["Sales - Direct sales"]
+    assert len(tracker.sessions) == 1
+
+def test_cli_status_command(runner, iso_fs):
     result = runner.invoke(cli, ["status"])
     assert result.exit_code == 0
 
-def test_cli_report_command(runner):
-    with runner.isolated_filesystem():
-        tracker = TimeTracker()
-        # Initialize an empty sessions list with the correct structure
-        tracker.sessions = [{
-            'main_category': 'Product dev',
-            'subcategory': 'Software development',
-            'description': 'Test task',
-            'start_time': '2024-01-01 10:00:00',
-            'end_time': '2024-01-01 11:00:00',
-            'duration': '1:00:00',
-            'duration_hours': 1.0,
-            'week': 1
-        }]
-        tracker._save_data()
-        
-        result = runner.invoke(cli, ["report"])
-        assert result.exit_code == 0
-        assert "Detailed Time Tracking Report" in result.output
-def test_invalid_subcategory(tracker):
+@pytest.mark.parametrize("args", [["status"], ["categories"], ["start", "Sales", "Direct sales"]])
+def test_cli_commands_skip_session_history(runner, iso_fs, monkeypatch, args):
+    def fail(self):
+        raise AssertionError("session history was loaded")
+    monkeypatch.setattr(TimeTracker, "_load_sessions", fail)
+
+    result = runner.invoke(cli, args)
+    assert result.exit_code == 0, result.output
+
+def test_cli_end_and_add_skip_session_history(runner, iso_fs, monkeypatch):
+    runner.invoke(cli, ["add", "--date", "2024-01-01", "--time", "10:00", "--duration", "1.0",
+                        "--main-category", "Sales", "--subcategory", "Direct sales"])
+    runner.invoke(cli, ["start", "Sales", "Direct sales"])
+    load_sessions = TimeTracker._load_sessions
+    def fail(self):
+        raise AssertionError("session history was loaded")
+    monkeypatch.setattr(TimeTracker, "_load_sessions", fail)
+
+    result = runner.invoke(cli, ["end"])
+    assert result.exit_code == 0, result.output
+    result = runner.invoke(cli, ["add", "--date", "2024-01-02", "--time", "10:00", "--duration", "1.0",
+                                 "--main-category", "Sales", "--subcategory", "Direct sales"])
+    assert result.exit_code == 0, result.output
+
+    monkeypatch.setattr(TimeTracker, "_load_sessions", load_sessions)
+    assert [s['id'] for s in TimeTracker().sessions] == [1, 2, 3]
+
+def test_cli_categories_uses_defaults_without_file(runner, iso_fs):
+    result = runner.invoke(cli, ["categories"])
+    assert "- Product dev" in result.output
+    assert not (iso_fs / ".timetrack_categories.json").exists()
+
+def test_default_categories_not_shared(iso_fs):
+    tracker = TimeTracker()
+    tracker.categories["Sales"].append("Cold calls")
+    del tracker.categories["Other"]
+
+    assert TimeTracker().categories == TimeTracker.DEFAULT_CATEGORIES
+    assert "Cold calls" not in TimeTracker.DEFAULT_CATEGORIES["Sales"]
+
+def test_cli_categories_export(runner, iso_fs):
+    result = runner.invoke(cli, ["categories", "--export"])
+    assert result.exit_code == 0
+    categories_file = iso_fs / ".timetrack_categories.json"
+    assert json.loads(categories_file.read_text()) == TimeTracker.DEFAULT_CATEGORIES
+
+    categories_file.write_text(json.dumps({"Sales": ["Direct sales"]}))
+    result = runner.invoke(cli, ["categories"])
+    assert "- Sales" in result.output
+    assert "- Product dev" not in result.output
+
+def test_export_categories_writes_utf8(iso_fs):
+    tracker = TimeTracker()
+    tracker._categories = {"Försäljning": ["Möten"]}
+    tracker.export_categories()
+
+    assert "Försäljning" in tracker.categories_file.read_bytes().decode("utf-8")
+    assert tracker._load_categories() == {"Försäljning": ["Möten"]}
+
+def test_cli_report_command(runner, iso_fs):
+    tracker = TimeTracker()
+    tracker.sessions = [
+        make_session(1, 'Product dev', 'Software development', 'Test task', datetime.datetime(2024, 1, 1, 10, 0, 0), 1.0)
+    ]
+    tracker._save_data()
+    
+    result = runner.invoke(cli, ["report"])
+    assert result.exit_code == 0
+    assert "Detailed Time Tracking Report" in result.output
+@pytest.mark.parametrize("entry", [
+    pytest.param(lambda t, main, sub: t.start_timer(main, sub), id="start_timer"),
+    pytest.param(lambda t, main, sub: t.add_session(datetime.datetime.now(), 2.0, main, sub), id="add_session"),
+])
+@pytest.mark.parametrize("sub,ok", [("Software development", True), ("Invalid subcategory", False)])
+def test_subcategory_validation(no_save_tracker, entry, sub, ok):
+    if ok:
+        entry(no_save_tracker, "Product dev", sub)
+        return
     with pytest.raises(click.ClickException) as exc_info:
-        tracker.start_timer("Product dev", "Invalid subcategory")
+        entry(no_save_tracker, "Product dev", sub)
     assert "Invalid subcategory" in str(exc_info.value)
 
-def test_multiple_sessions(tracker):
+def test_multiple_sessions(no_save_tracker):
     # Clear existing sessions
-    tracker.sessions = []
+    no_save_tracker.sessions = []
     
     # Start and end multiple sessions
-    tracker.start_timer("Product dev", "Software development", "Task 1")
-    tracker.end_timer("Product dev", "Software development")
-    tracker.start_timer("Sales", "Direct sales", "Task 2")
-    tracker.end_timer("Sales", "Direct sales")
+    no_save_tracker.start_timer("Product dev", "Software development", "Task 1")
+    no_save_tracker.end_timer("Product dev", "Software development")
+    no_save_tracker.start_timer("Sales", "Direct sales", "Task 2")
+    no_save_tracker.end_timer("Sales", "Direct sales")
     
-    assert len(tracker.sessions) == 2
+    assert len(no_save_tracker.sessions) == 2
 
 def test_report_generation(tracker, capsys):
-    # Clear existing sessions
-    tracker.sessions = []
-    
-    # Add a test session
-    tracker.start_timer("Product dev", "Software development", "Task 1")
-    tracker.end_timer("Product dev", "Software development")
+    tracker.sessions = [
+        make_session(1, "Product dev", "Software development", "Task 1", datetime.datetime(2024, 1, 1, 10, 0), 1.0),
+        make_session(2, "Sales", "Direct sales", "Task 2", datetime.datetime(2024, 1, 2, 10, 0), 0.5)
+    ]
+    tracker._save_data()
     
     # Test detailed report
     tracker.generate_report(format_type="detailed")
     captured = capsys.readouterr()
     assert "Detailed Time Tracking Report" in captured.out
+    assert "2024-01-02     1" in captured.out
+    
+    # Test cospend report
+    tracker.generate_report(format_type="cospend")
+    captured = capsys.readouterr()
+    assert captured.out.index("Date: 2024-01-01") < captured.out.index("Date: 2024-01-02")
+    assert "Sales - Direct sales: Task 2 (0.50)" in captured.out
     
     # Test summary report
     tracker.generate_report(format_type="summary")
     captured = capsys.readouterr()
     assert "Time Tracking Summary" in captured.out
+    assert " - Software development: (1.00)" in captured.out
+    assert "Total: (0.50)" in captured.out
+    assert "Total Hours: 1.50" in captured.out
 
 def test_edit_session(tracker):
-    # Create a test session
-    tracker.start_timer("Product dev", "Software development", "Test task")
-    tracker.end_timer("Product dev", "Software development")
+    tracker.sessions = [
+        make_session(1, "Product dev", "Software development", "Test task", datetime.datetime(2024, 1, 1, 10, 0), 1.0)
+    ]
+    tracker._save_data()
     
-    # Get the session id
     session_id = tracker.sessions[0]['id']
     
     # Edit the session
@@ -127,60 +186,63 @@ def test_edit_session(tracker):
     assert updated_session['duration_hours'] == 3.0
     assert updated_session['duration'] == '3:00:00'
 
-def test_edit_session_invalid_id(tracker):
+def test_sessions_loaded_as_datetimes(tracker):
+    tracker.start_timer("Product dev", "Software development", "Task 1")
+    tracker.end_timer("Product dev", "Software development")
+    tracker._load_data()
+
+    assert isinstance(tracker.sessions[0]['start_time'], datetime.datetime)
+    assert isinstance(tracker.sessions[0]['end_time'], datetime.datetime)
+
+def test_edit_session_invalid_id(no_save_tracker):
     with pytest.raises(click.ClickException) as exc_info:
-        tracker.edit_session(999, 3.0)
+        no_save_tracker.edit_session(999, 3.0)
     assert "No session found with id 999" in str(exc_info.value)
 
-def test_cli_edit_command(runner):
-    with runner.isolated_filesystem():
-        # First create a session
-        tracker = TimeTracker()
-        tracker.sessions = [{
-            'id': 1,
-            'main_category': 'Product dev',
-            'subcategory': 'Software development',
-            'description': 'Test task',
-            'start_time': datetime.datetime(2024, 1, 1, 10, 0, 0),  # Use datetime object
-            'end_time': datetime.datetime(2024, 1, 1, 11, 0, 0),    # Use datetime object
-            'duration': '1:00:00',
-            'duration_hours': 1.0,
-            'week': 1
-        }]
-        tracker._save_data()
-        
-        result = runner.invoke(cli, ["edit", "--id", "1", "--duration", "3.0"])
-        assert result.exit_code == 0
-        assert "Updated session 1" in result.output
-        assert "3.00h" in result.output
-
-def test_cli_edit_wizard(runner):
-    with runner.isolated_filesystem():
-        # Setup test data
-        tracker = TimeTracker()
-        tracker.sessions = [{
-            'id': 1,
-            'main_category': 'Product dev',
-            'subcategory': 'Software development',
-            'description': 'Test task',
-            'start_time': datetime.datetime(2024, 1, 1, 10, 0, 0),  # Use datetime object
-            'end_time': datetime.datetime(2024, 1, 1, 11, 0, 0),    # Use datetime object
-            'duration': '1:00:00',
-            'duration_hours': 1.0,
-            'week': 1
-        }]
-        tracker._save_data()
-        
-        # Simulate wizard input
-        result = runner.invoke(cli, ["edit"], input="1\n2.5\n")
-        assert result.exit_code == 0
-        assert "Updated session 1" in result.output
-        assert "2.50h" in result.output
-
-def test_add_session(tracker):
+def test_cli_edit_command(runner, iso_fs):
+    # First create a session
+    tracker = TimeTracker()
+    tracker.sessions = [
+        make_session(1, 'Product dev', 'Software development', 'Test task', datetime.datetime(2024, 1, 1, 10, 0, 0), 1.0)
+    ]
+    tracker._save_data()
+    
+    result = runner.invoke(cli, ["edit", "--id", "1", "--duration", "3.0"])
+    assert result.exit_code == 0
+    assert "Updated session 1" in result.output
+    assert "3.00h" in result.output
+
+def test_cli_edit_wizard(runner, iso_fs):
+    # Setup test data
+    tracker = TimeTracker()
+    tracker.sessions = [
+        make_session(1, 'Product dev', 'Software development', 'Test task', datetime.datetime(2024, 1, 1, 10, 0, 0), 1.0)
+    ]
+    tracker._save_data()
+    
+    # Simulate wizard input
+    result = runner.invoke(cli, ["edit"], input="1\n2.5\n")
+    assert result.exit_code == 0
+    assert "Updated session 1" in result.output
+    assert "2.50h" in result.output
+
+def test_cli_edit_wizard_reprompts_on_piped_garbage(runner, iso_fs):
+    tracker = TimeTracker()
+    tracker.sessions = [
+        make_session(1, 'Product dev', 'Software development', 'Test task', datetime.datetime(2024, 1, 1, 10, 0, 0), 1.0)
+    ]
+    tracker._save_data()
+
+    result = runner.invoke(cli, ["edit"], input="abc\n7\n1\n2.5\n")
+    assert result.exit_code == 0
+    assert "Please enter a valid number." in result.output
+    assert "Invalid session ID." in result.output
+    assert "Updated session 1" in result.output
+
+def test_add_session(no_save_tracker):
     # Test direct session addition
     date = datetime.datetime(2024, 1, 1, 10, 0)
-    session = tracker.add_session(
+    session = no_save_tracker.add_session(
         date=date,
         duration_hours=2.0,
         main_category="Product dev",
@@ -194,35 +256,182 @@ def test_add_session(tracker):
     assert session['start_time'] == date
     assert session['end_time'] == date + datetime.timedelta(hours=2.0)
 
-def test_cli_add_command(runner):
-    with runner.isolated_filesystem():
-        result = runner.invoke(cli, [
-            "add",
-            "--date", "2024-01-01",
-            "--time", "10:00",
-            "--duration", "2.0",
-            "--main_category", "Product dev",
-            "--subcategory", "Software development",
-            "--description", "Test task"
-        ])
-        assert result.exit_code == 0
-        assert "Added new session" in result.output
-
-def test_cli_add_wizard(runner):
-    with runner.isolated_filesystem():
-        # Simulate wizard input
-        inputs = "2024-01-01\n10:00\n2.0\n1\n1\nTest task\n"
-        result = runner.invoke(cli, ["add"], input=inputs)
-        assert result.exit_code == 0
-        assert "Added new session" in result.output
-        assert "Test task" in result.output
-
-def test_add_session_invalid_category(tracker):
-    with pytest.raises(click.ClickException) as exc_info:
-        tracker.add_session(
-            date=datetime.datetime.now(),
-            duration_hours=2.0,
-            main_category="Product dev",
-            subcategory="Invalid subcategory"
-        )
-    assert "Invalid subcategory" in str(exc_info.value)
+def test_add_session_saved_as_iso_string(tracker):
+    date = datetime.datetime(2024, 1, 1, 10, 0)
+    tracker.add_session(date, 2.0, "Product dev", "Software development")
+
+    saved = json.loads(tracker.sessions_file.read_text())
+    assert saved['start_time'] == '2024-01-01T10:00:00'
+    assert saved['end_time'] == '2024-01-01T12:00:00'
+
+def test_cli_add_command(runner, iso_fs):
+    result = runner.invoke(cli, [
+        "add",
+        "--date", "2024-01-01",
+        "--time", "10:00",
+        "--duration", "2.0",
+        "--main-category", "Product dev",
+        "--subcategory", "Software development",
+        "--description", "Test task"
+    ])
+    assert result.exit_code == 0
+    assert "Added new session" in result.output
+
+def test_cli_add_wizard(runner, iso_fs):
+    # Simulate wizard input
+    inputs = "2024-01-01\n10:00\n2.0\n1\n1\nTest task\n"
+    result = runner.invoke(cli, ["add"], input=inputs)
+    assert result.exit_code == 0
+    assert "Added new session" in result.output
+    assert "Test task" in result.output
+
+def test_sessions_saved_as_jsonl(tracker):
+    tracker.sessions = [
+        make_session(1, "Product dev", "Software development", "Task 1", datetime.datetime(2024, 1, 1, 10, 0), 1.0)
+    ]
+    tracker._save_data()
+    tracker.sessions.append(
+        make_session(2, "Sales", "Direct sales", "Task 2", datetime.datetime(2024, 1, 2, 10, 0), 0.5)
+    )
+    tracker._save_data()
+
+    lines = tracker.sessions_file.read_text().splitlines()
+    assert [json.loads(line)['id'] for line in lines] == [1, 2]
+    assert 'sessions' not in json.loads(tracker.data_file.read_text())
+
+    tracker.remove_session(1)
+    tracker.edit_session(2, 2.0)
+    lines = tracker.sessions_file.read_text().splitlines()
+    assert [json.loads(line).get('op') for line in lines] == [None, None, 'remove', 'edit']
+    tracker._load_data()
+    assert [(s['id'], s['duration_hours']) for s in tracker.sessions] == [(2, 2.0)]
+
+    assert tracker.compact_sessions() == 1
+    lines = tracker.sessions_file.read_text().splitlines()
+    assert [json.loads(line)['id'] for line in lines] == [2]
+    tracker._load_data()
+    assert tracker.sessions[0]['end_time'] == datetime.datetime(2024, 1, 2, 12, 0)
+
+def test_cli_remove_several_ids(runner, iso_fs):
+    tracker = TimeTracker()
+    tracker.sessions = [
+        make_session(i, "Sales", "Direct sales", f"Task {i}", datetime.datetime(2024, 1, i, 10, 0), 1.0)
+        for i in range(1, 4)
+    ]
+    tracker._save_data()
+
+    result = runner.invoke(cli, ["remove", "--id", "1", "--id", "3"])
+    assert result.exit_code == 0
+    assert "Removed session 1, 3" in result.output
+    assert [s['id'] for s in TimeTracker().sessions] == [2]
+
+    result = runner.invoke(cli, ["remove", "--id", "2", "--id", "7"])
+    assert result.exit_code != 0
+    assert "No session found with id 7" in result.output
+    assert [s['id'] for s in TimeTracker().sessions] == [2]
+
+def test_legacy_sessions_moved_to_jsonl(iso_fs):
+    session = make_session(1, "Product dev", "Software development", "Task 1", datetime.datetime(2024, 1, 1, 10, 0), 1.0)
+    (iso_fs / ".timetrack_data.json").write_text(json.dumps({'active_timers': {}, 'sessions': [session]}, default=str))
+
+    tracker = TimeTracker()
+    assert tracker.sessions == [session]
+    tracker._save_data()
+
+    assert 'sessions' not in json.loads(tracker.data_file.read_text())
+    assert TimeTracker().sessions == [session]
+
+def test_legacy_sessions_kept_by_commands_that_skip_history(runner, iso_fs):
+    session = make_session(1, "Product dev", "Software development", "Task 1", datetime.datetime(2024, 1, 1, 10, 0), 1.0)
+    (iso_fs / ".timetrack_data.json").write_text(json.dumps({'active_timers': {}, 'sessions': [session]}, default=str))
+
+    result = runner.invoke(cli, ["start", "Sales", "Direct sales"])
+    assert result.exit_code == 0
+    assert TimeTracker().sessions == [session]
+
+def test_session_ids_not_reused_after_remove(tracker):
+    tracker.add_session(datetime.datetime(2024, 1, 1, 10, 0), 1.0, "Sales", "Direct sales")
+    tracker.add_session(datetime.datetime(2024, 1, 2, 10, 0), 1.0, "Sales", "Direct sales")
+    tracker.remove_session(1)
+
+    session = tracker.add_session(datetime.datetime(2024, 1, 3, 10, 0), 1.0, "Sales", "Direct sales")
+    assert session['id'] == 3
+    assert json.loads(tracker.data_file.read_text())['next_id'] == 4
+
+def test_cli_status_elapsed_from_start_epoch(runner, iso_fs):
+    runner.invoke(cli, ["start", "Sales", "Direct sales", "-o", "90"])
+    result = runner.invoke(cli, ["status"])
+    assert "Running: 01:30:0" in result.output
+
+    # Timers saved before start_epoch existed fall back to the ISO start time
+    data_file = iso_fs / ".timetrack_data.json"
+    data = json.loads(data_file.read_text())
+    del data['active_timers']["Sales - Direct sales"]['start_epoch']
+    data_file.write_text(json.dumps(data))
+    result = runner.invoke(cli, ["status"])
+    assert "Running: 01:30:0" in result.output
+
+def test_next_id_saved_for_data_file_without_counter(iso_fs):
+    sessions = [make_session(i, "Sales", "Direct sales", f"Task {i}", datetime.datetime(2024, 1, i, 10, 0), 1.0) for i in (1, 2)]
+    (iso_fs / ".timetrack_sessions.jsonl").write_text("".join(json.dumps(s, default=str) + "\n" for s in sessions))
+
+    tracker = TimeTracker()
+    assert len(tracker.sessions) == 2
+    tracker.start_timer("Sales", "Direct sales")
+    assert json.loads(tracker.data_file.read_text())['next_id'] == 3
+
+def test_removed_highest_id_not_reused(runner, iso_fs):
+    # Data file from before the id counter, sessions still inside it
+    sessions = [make_session(i, "Sales", "Direct sales", f"Task {i}", datetime.datetime(2024, 1, i, 10, 0), 1.0) for i in (1, 2, 3)]
+    (iso_fs / ".timetrack_data.json").write_text(json.dumps({'active_timers': {}, 'sessions': sessions}, default=str))
+    add = ["add", "--date", "2024-01-04", "--time", "10:00", "--duration", "1.0",
+           "--main-category", "Sales", "--subcategory", "Direct sales"]
+
+    runner.invoke(cli, ["remove", "--id", "3"])
+    result = runner.invoke(cli, add)
+    assert "Added new session 4" in result.output
+    assert [s['id'] for s in TimeTracker().sessions] == [1, 2, 4]
+
+    # A log whose highest id was removed, with no counter in the data file
+    runner.invoke(cli, ["remove", "--id", "4"])
+    (iso_fs / ".timetrack_data.json").write_text(json.dumps({'active_timers': {}}))
+    result = runner.invoke(cli, add)
+    assert "Added new session 5" in result.output
+    assert [s['id'] for s in TimeTracker().sessions] == [1, 2, 5]
+
+def test_noop_remove_skips_write(runner, iso_fs, monkeypatch):
+    runner.invoke(cli, ["add", "--date", "2024-01-01", "--time", "10:00", "--duration", "1.0",
+                        "--main-category", "Sales", "--subcategory", "Direct sales"])
+    writes = []
+    monkeypatch.setattr(Path, "write_bytes", lambda path, data: writes.append(path.name))
+
+    result = runner.invoke(cli, ["remove", "--day", "0"])
+    assert result.exit_code == 0
+    assert "Removed 0 sessions" in result.output
+    assert writes == []
+
+def test_noop_remove_all_skips_write(runner, iso_fs, monkeypatch):
+    writes = []
+    monkeypatch.setattr(Path, "write_bytes", lambda path, data: writes.append(path.name))
+
+    result = runner.invoke(cli, ["remove", "--all"])
+    assert result.exit_code == 0
+    assert "Removed all 0 sessions" in result.output
+    assert writes == []
+
+def test_dumps_same_without_orjson(monkeypatch):
+    from timetrack import cli as cli_module
+    session = make_session(1, "Sales", "Direct sales", "Möte med kund", datetime.datetime(2024, 1, 1, 10, 0, 0, 500), 1.0)
+    with_orjson = cli_module._dumps(session)
+    monkeypatch.setattr(cli_module, "orjson", None)
+    assert cli_module._dumps(session) == with_orjson
+
+def test_sessions_file_blank_and_corrupt_lines(tracker):
+    session = make_session(1, "Sales", "Direct sales", "Task 1", datetime.datetime(2024, 1, 1, 10, 0), 1.0)
+    tracker.sessions_file.write_bytes(json.dumps(session, default=str).encode() + b'\n   \n\n')
+    tracker._load_data()
+    assert [s['id'] for s in tracker.sessions] == [1]
+
+    tracker.sessions_file.write_bytes(json.dumps(session, default=str).encode() + b'\n{bad json}\n')
+    with pytest.raises(ValueError):
+        tracker._load_data()
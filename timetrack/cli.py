@@ -1,103 +1,432 @@
 #!/usr/bin/env python3
 import click
-import datetime
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from functools import cached_property
+from itertools import groupby
 import json
+from operator import itemgetter
 from pathlib import Path
-from enum import Enum
-from typing import Dict, List, Optional
+import sys
+import time
+from typing import Dict, Iterable, List, Optional
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the stdlib json module
+    orjson = None
+
+
+# One row of the detailed report, also used for its header so the columns line up
+DETAILED_ROW_FMT = "{id:<5}{main:<15} {sub:<30} {desc:<30} {dur:<10} {date:<15}{week:<5}"
+
+# Fetches the fields the summary report adds up in one C-level call per session
+_summary_fields = itemgetter('main_category', 'subcategory', 'duration_hours')
+
+
+def _fast_prompt_int(text: str) -> int:
+    """Prompt for an integer, reading piped input directly.
+
+    On a terminal this is click.prompt. For scripted input it skips Click's
+    prompt machinery; invalid input raises ValueError for the caller to handle.
+    """
+    if sys.stdin.isatty():
+        return click.prompt(text, type=int, prompt_suffix=": ")
+    click.echo(f"{text}: ", nl=False)
+    line = sys.stdin.readline()
+    if not line:
+        raise click.Abort()
+    return int(line)
+
+
+def _json_default(value):
+    """Write datetimes as ISO 8601 strings, the same format start_timer stores."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+def _dumps(obj) -> bytes:
+    """Serialize obj to compact JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        # orjson writes datetimes natively. No OPT_NAIVE_UTC: stored times are
+        # local time and must stay naive, like the ISO strings start_timer stores
+        return orjson.dumps(obj, default=_json_default)
+    return json.dumps(obj, default=_json_default, separators=(',', ':'), ensure_ascii=False).encode()
+
+
+def _loads(data: bytes):
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _running_seconds(timer_data: Dict, now: float) -> float:
+    """Seconds since a running timer was started or resumed, given now = time.time()."""
+    start_epoch = timer_data.get('start_epoch')
+    if start_epoch is None:
+        # Timers started by older versions only have the ISO start time
+        start_epoch = datetime.fromisoformat(timer_data['start_time']).timestamp()
+    return now - start_epoch
+
+
+def _parse_session(session: Dict) -> Dict:
+    """Prepare a session loaded from disk for use in memory.
+
+    ISO timestamps become datetimes, once per load. Category names are
+    interned, since a handful of distinct values repeat across every session.
+    """
+    for key in ('start_time', 'end_time'):
+        if isinstance(session.get(key), str):
+            session[key] = datetime.fromisoformat(session[key])
+    for key in ('main_category', 'subcategory'):
+        if isinstance(session.get(key), str):
+            session[key] = sys.intern(session[key])
+    return session
 
 
 class TimeTracker:
+    # Default categories if no categories file exists
+    DEFAULT_CATEGORIES = {
+        "Product dev": ["Software development", "SysAdmin for products", "Tech check-in for development"],
+        "Swarm Support": ["Tech support", "Tech maintenance", "Communication", "Administration", "Coordination"],
+        "Internal Tech": ["Support", "Galaxy", "Homepage development", "SysAdmin", "Tech Coordination", "Tech check-in SysAdmin"],
+        "Sales": ["Direct sales", "Sales meetings/calls", "CRM work", "Customer research", "Marketing & Sales Meeting"],
+        "Marketing": ["Branding", "Campaigns", "Social media", "Homepage maintenance", "Design", "Marketing & Sales Meeting"],
+        "Admin & Coord": ["Financial", "Administration", "Legal", "Planning", "Board", "Quality management", 
+                          "Coordination meetings", "General communication", "General Sprint meetings"],
+        "Other": ["MetaLand", "Other Other"]
+    }
+
     def __init__(self):
         self.data_file = Path.home() / '.timetrack_data.json'
+        self.sessions_file = Path.home() / '.timetrack_sessions.jsonl'
         self.categories_file = Path.home() / '.timetrack_categories.json'
-        self.categories = self._load_categories()
-        self._load_data()
+        # Loaded on first access, so e.g. `status` never parses the session history
+        self._categories = None
+        self._active_timers = None
+        self._sessions = None
+        # Parsed data file, shared by the loaders so it is read only once
+        self._data = None
+        self._saved_sessions = 0
+        # Edits and removals waiting to be appended to the sessions file
+        self._pending_events: List[Dict] = []
+        # Sessions added without loading the history, e.g. by `end`
+        self._new_sessions: List[Dict] = []
+        self._next_id = None
+        # Set by the methods that change timers or sessions in place
+        self._dirty = False
+        self._batching = False
+        self._save_pending = False
+
+    @property
+    def categories(self) -> Dict[str, List[str]]:
+        if self._categories is None:
+            self._categories = self._load_categories()
+        return self._categories
+
+    @property
+    def active_timers(self) -> Dict[str, Dict]:
+        if self._active_timers is None:
+            self._load_active_timers()
+        return self._active_timers
+
+    @active_timers.setter
+    def active_timers(self, active_timers: Dict[str, Dict]):
+        self._active_timers = active_timers
+
+    @property
+    def sessions(self) -> List[Dict]:
+        if self._sessions is None:
+            self._load_sessions()
+        return self._sessions
+
+    @sessions.setter
+    def sessions(self, sessions: List[Dict]):
+        # Keep an id -> session index next to the list for O(1) lookups
+        self._sessions = sessions
+        self._session_index = {s['id']: s for s in sessions}
+
+    @property
+    def _by_id(self) -> Dict[int, Dict]:
+        if self._sessions is None:
+            self._load_sessions()
+        return self._session_index
 
     def _load_data(self):
-        if self.data_file.exists():
-            with open(self.data_file) as f:
-                data = json.load(f)
-                self.active_timers = data.get('active_timers', {})
-                self.sessions = data.get('sessions', [])
-        else:
-            self.active_timers = {}
-            self.sessions = []
+        """Load active timers and sessions from disk."""
+        self._data = None
+        self._load_active_timers()
+        self._load_sessions()
+
+    def _read_data_file(self) -> Dict:
+        if self._data is None:
+            try:
+                self._data = _loads(self.data_file.read_bytes())
+            except FileNotFoundError:
+                self._data = {}
+        return self._data
+
+    def _load_active_timers(self):
+        data = self._read_data_file()
+        self.active_timers = data.get('active_timers', {})
+        self._next_id = data.get('next_id')
+
+    def _load_sessions(self):
+        """Load sessions by replaying the JSONL sessions file.
+
+        Plain lines are sessions. Lines with an "op" record a later edit or
+        removal of a session by id. The id counter is kept past every id in
+        the file, removed ones included, so ids are never reused and the
+        events can be applied after reading all sessions.
+        """
+        self._saved_sessions = 0
+        self._pending_events = []
+        try:
+            lines = self.sessions_file.read_bytes().splitlines()
+        except FileNotFoundError:
+            # Older versions kept sessions in the data file, they move to
+            # the sessions file on the next save
+            self.sessions = [_parse_session(s) for s in self._read_data_file().get('sessions', [])]
+            self._merge_new_sessions()
+            self._cover_ids(max(self._session_index, default=0))
+            return
+        sessions, edited, removed = [], {}, set()
+        highest_id = 0
+        for line in lines:
+            if not line.strip():
+                continue
+            entry = _loads(line)
+            op = entry.get('op')
+            if op is None:
+                sessions.append(_parse_session(entry))
+                highest_id = max(highest_id, entry['id'])
+            elif op == 'edit':
+                edited[entry['session']['id']] = entry['session']
+            elif op == 'remove':
+                removed.update(entry['ids'])
+                highest_id = max(highest_id, max(entry['ids'], default=0))
+        self.sessions = [
+            _parse_session(edited[s['id']]) if s['id'] in edited else s
+            for s in sessions if s['id'] not in removed
+        ]
+        self._saved_sessions = len(self.sessions)
+        self._merge_new_sessions()
+        self._cover_ids(max(highest_id, max(self._session_index, default=0)))
+
+    def _merge_new_sessions(self):
+        """Move sessions added before the history was loaded into the list."""
+        for session in self._new_sessions:
+            self._add_to_sessions(session)
+        self._new_sessions = []
+
+    def _add_to_sessions(self, session: Dict):
+        """Add a new session. The history is only loaded if it already was."""
+        if self._sessions is None:
+            self._new_sessions.append(session)
+            return
+        self._sessions.append(session)
+        self._session_index[session['id']] = session
+
+    def reset(self):
+        """Forget all timers and sessions in memory without touching the files."""
+        self.active_timers = {}
+        self.sessions = []
+        self._data = None
+        self._saved_sessions = 0
+        self._pending_events = []
+        self._new_sessions = []
+        self._next_id = None
+        self._dirty = False
 
     def _load_categories(self):
         """Load categories from JSON file or return defaults."""
-        if self.categories_file.exists():
-            with open(self.categories_file) as f:
-                return json.load(f)
-        
-        # Default categories if no file exists
-        default_categories = {
-            "Product dev": ["Software development", "SysAdmin for products", "Tech check-in for development"],
-            "Swarm Support": ["Tech support", "Tech maintenance", "Communication", "Administration", "Coordination"],
-            "Internal Tech": ["Support", "Galaxy", "Homepage development", "SysAdmin", "Tech Coordination", "Tech check-in SysAdmin"],
-            "Sales": ["Direct sales", "Sales meetings/calls", "CRM work", "Customer research", "Marketing & Sales Meeting"],
-            "Marketing": ["Branding", "Campaigns", "Social media", "Homepage maintenance", "Design", "Marketing & Sales Meeting"],
-            "Admin & Coord": ["Financial", "Administration", "Legal", "Planning", "Board", "Quality management", 
-                            "Coordination meetings", "General communication", "General Sprint meetings"],
-            "Other": ["MetaLand", "Other Other"]
-        }
-        
-        # Save default categories to file
-        with open(self.categories_file, 'w') as f:
-            json.dump(default_categories, f, indent=2)
-        
-        return default_categories
+        try:
+            categories = _loads(self.categories_file.read_bytes())
+        except FileNotFoundError:
+            # Nothing to parse or write, the file only exists once the user customizes it.
+            # Copied so changes to one tracker's categories never reach the defaults
+            return {main: list(subs) for main, subs in self.DEFAULT_CATEGORIES.items()}
+        return {sys.intern(main): [sys.intern(sub) for sub in subs] for main, subs in categories.items()}
+
+    def export_categories(self) -> Path:
+        """Write the categories to the categories file so they can be edited."""
+        # Indented, unlike the data files, since this one is meant for people
+        # UTF-8 whatever the locale, _load_categories reads it back as bytes
+        self.categories_file.write_bytes((json.dumps(self.categories, indent=2, ensure_ascii=False) + "\n").encode())
+        return self.categories_file
+
+    @contextmanager
+    def _batched_save(self):
+        """Turn the _save_data calls inside the block into one save on exit."""
+        self._batching = True
+        try:
+            yield
+        finally:
+            self._batching = False
+            if self._save_pending:
+                self._save_pending = False
+                self._save_data()
 
     def _save_data(self):
+        """Save active timers and append changes to the sessions file.
+
+        The sessions file is append-only: a save adds the logged edits and
+        removals and the sessions added since the last save. Only replacing
+        self.sessions with a shorter list, e.g. removing all sessions, writes
+        the whole file again; `timetrack compact` does so on request.
+
+        Nothing is written when nothing changed: timers mark the tracker
+        dirty, session changes show up as events or in the session count.
+        """
+        if self._batching:
+            self._save_pending = True
+            return
+
+        sessions_changed = bool(self._new_sessions) or (self._sessions is not None and (
+            self._pending_events or len(self._sessions) != self._saved_sessions))
+        if not (self._dirty or sessions_changed):
+            return
+
+        # Sessions still in an old data file have to be moved out before it
+        # is overwritten
+        if self._sessions is None and 'sessions' in self._read_data_file():
+            self._load_sessions()
+
+        # Without the history loaded only new sessions can have been added
+        if self._sessions is not None:
+            if len(self._sessions) < self._saved_sessions:
+                self._rewrite_sessions()
+            else:
+                self._append_sessions(self._sessions[self._saved_sessions:])
+        elif self._new_sessions:
+            self._append_sessions(self._new_sessions)
+            self._new_sessions = []
+
         data = {
-            'active_timers': self.active_timers,
-            'sessions': self.sessions
+            'active_timers': self.active_timers
         }
-        with open(self.data_file, 'w') as f:
-            json.dump(data, f, default=str)
+        if self._next_id is not None:
+            data['next_id'] = self._next_id
+        self.data_file.write_bytes(_dumps(data))
+        self._data = data
+        self._dirty = False
+
+    def _cover_ids(self, highest_id: int):
+        """Move the id counter past highest_id, it is saved with the next save.
+
+        Called when sessions are loaded, so data files written before the
+        counter existed get one.
+        """
+        if self._active_timers is None:
+            self._load_active_timers()
+        if self._next_id is None or self._next_id <= highest_id:
+            self._next_id = highest_id + 1
+
+    def _new_session_id(self) -> int:
+        """Hand out the next session id.
+
+        The counter is kept in the data file, so ids are never reused after a
+        session is removed. Data files without it continue from the highest id.
+        """
+        if self._active_timers is None:
+            self._load_active_timers()
+        if self._next_id is None:
+            self._cover_ids(max(self._by_id, default=0))
+        session_id = self._next_id
+        self._next_id += 1
+        return session_id
+
+    def _append_sessions(self, sessions: List[Dict]):
+        """Append the pending events and then sessions to the sessions file."""
+        entries = self._pending_events + sessions
+        if entries:
+            # Encode everything first so the file gets a single write
+            payload = b''.join(_dumps(entry) + b'\n' for entry in entries)
+            with open(self.sessions_file, 'ab') as f:
+                f.write(payload)
+            self._saved_sessions += len(sessions)
+            self._pending_events = []
+
+    def _rewrite_sessions(self):
+        """Replace the sessions file with the sessions in memory."""
+        self.sessions_file.write_bytes(b''.join(_dumps(session) + b'\n' for session in self._sessions))
+        self._saved_sessions = len(self._sessions)
+        self._pending_events = []
+
+    def compact_sessions(self) -> int:
+        """Collapse the logged edits and removals into one line per session."""
+        sessions = self.sessions
+        self._rewrite_sessions()
+        # Also saves the data file, which drops sessions an older version left in it
+        self._dirty = True
+        self._save_data()
+        return len(sessions)
 
     def get_subcategories(self, main_category: str) -> List[str]:
         return self.categories.get(main_category, [])
 
-    def start_timer(self, main_category: str, subcategory: str, description: str = "", offset_minutes: int = 0):
-        if not subcategory in self.get_subcategories(main_category):
+    @cached_property
+    def _subcategory_sets(self) -> Dict[str, frozenset]:
+        return {main: frozenset(subs) for main, subs in self.categories.items()}
+
+    @cached_property
+    def _category_order(self) -> Dict[str, int]:
+        return {main: i for i, main in enumerate(self.categories)}
+
+    @cached_property
+    def _categories_block(self) -> str:
+        """The `categories` listing, formatted once."""
+        return "\nAvailable categories:\n" + "\n".join(f"- {category}" for category in self.categories)
+
+    def _check_subcategory(self, main_category: str, subcategory: str):
+        """Raise a ClickException unless subcategory belongs to main_category."""
+        if subcategory not in self._subcategory_sets.get(main_category, ()):
             valid_subcategories = "\n".join(f"- {sub}" for sub in self.get_subcategories(main_category))
             raise click.ClickException(
                 f"Invalid subcategory! Valid subcategories for {main_category} are:\n{valid_subcategories}"
             )
 
-        # Check if any active timers are already running
-        if self.active_timers:
-            click.echo("A timer is already active:")
-            for timer_key, timer_data in self.active_timers.items():
-                click.echo(f" - {timer_key} running since {timer_data['start_time']}")
-
-            # Ask the user if they want to stop the current timer
-            if click.confirm("Do you want to stop the current timer before starting a new one?", default=True):
-                # Stop the active timers
-                for timer_key in list(self.active_timers.keys()):
-                    self.end_timer(
-                        self.active_timers[timer_key]['main_category'],
-                        self.active_timers[timer_key]['subcategory']
-                    )
-            else:
-                raise click.ClickException("Please stop the current timer before starting a new one.")
-
-         # Calculate start time with offset
-        
-        start_time = datetime.datetime.now() - datetime.timedelta(minutes=offset_minutes)
+    def start_timer(self, main_category: str, subcategory: str, description: str = "", offset_minutes: int = 0):
+        self._check_subcategory(main_category, subcategory)
+
+        # Ending the running timers and starting the new one is saved once
+        with self._batched_save():
+            # Check if any active timers are already running
+            if self.active_timers:
+                click.echo("A timer is already active:")
+                for timer_key, timer_data in self.active_timers.items():
+                    click.echo(f" - {timer_key} running since {timer_data['start_time']}")
+
+                # Ask the user if they want to stop the current timer
+                if click.confirm("Do you want to stop the current timer before starting a new one?", default=True):
+                    # Stop the active timers
+                    for timer_key in list(self.active_timers.keys()):
+                        self.end_timer(
+                            self.active_timers[timer_key]['main_category'],
+                            self.active_timers[timer_key]['subcategory']
+                        )
+                else:
+                    raise click.ClickException("Please stop the current timer before starting a new one.")
+
+            # Calculate start time with offset
+            start_time = datetime.now() - timedelta(minutes=offset_minutes)
 
-        timer_key = f"{main_category} - {subcategory}"
-        self.active_timers[timer_key] = {
-            'start_time': start_time.isoformat(),
-            'main_category': main_category,
-            'subcategory': subcategory,
-            'description': description,
-            'accumulated_seconds': 0.0,
-            'paused': False,
-            'pause_time': None
-        }
-        self._save_data()
+            timer_key = f"{main_category} - {subcategory}"
+            self.active_timers[timer_key] = {
+                'start_time': start_time.isoformat(),
+                'start_epoch': start_time.timestamp(),
+                'main_category': main_category,
+                'subcategory': subcategory,
+                'description': description,
+                'accumulated_seconds': 0.0,
+                'paused': False,
+                'pause_time': None
+            }
+            self._dirty = True
+            self._save_data()
         click.echo(f"Started timer for '{timer_key}' - {description} (offset: {offset_minutes} minutes)")
 
     def pause_timer(self):
@@ -111,14 +440,14 @@ class TimeTracker:
         if timer_data['paused']:
             raise click.ClickException(f"Timer '{timer_key}' is already paused.")
 
-        start_time = datetime.datetime.fromisoformat(timer_data['start_time'])
-        now = datetime.datetime.now()
-        elapsed = (now - start_time).total_seconds()
-        timer_data['accumulated_seconds'] += elapsed
+        now = time.time()
+        timer_data['accumulated_seconds'] += _running_seconds(timer_data, now)
         timer_data['paused'] = True
-        timer_data['pause_time'] = now.isoformat()
+        timer_data['pause_time'] = datetime.fromtimestamp(now).isoformat()
         timer_data['start_time'] = None
+        timer_data['start_epoch'] = None
 
+        self._dirty = True
         self._save_data()
         click.echo(f"Paused timer '{timer_key}'")
     
@@ -133,10 +462,13 @@ class TimeTracker:
         if not timer_data['paused']:
             raise click.ClickException(f"Timer '{timer_key}' is not paused.")
 
+        now = datetime.now()
         timer_data['paused'] = False
-        timer_data['start_time'] = datetime.datetime.now().isoformat()
+        timer_data['start_time'] = now.isoformat()
+        timer_data['start_epoch'] = now.timestamp()
         timer_data['pause_time'] = None
 
+        self._dirty = True
         self._save_data()
         click.echo(f"Resumed timer '{timer_key}'")
         
@@ -151,11 +483,7 @@ class TimeTracker:
         # Get main category selection
         while True:
             try:
-                category_idx = click.prompt(
-                    "Select category number",
-                    type=int,
-                    prompt_suffix=": "
-                )
+                category_idx = _fast_prompt_int("Select category number")
                 if 1 <= category_idx <= len(categories):
                     main_category = categories[category_idx - 1]
                     break
@@ -172,11 +500,7 @@ class TimeTracker:
         # Get subcategory selection
         while True:
             try:
-                subcategory_idx = click.prompt(
-                    "Select subcategory number",
-                    type=int,
-                    prompt_suffix=": "
-                )
+                subcategory_idx = _fast_prompt_int("Select subcategory number")
                 if 1 <= subcategory_idx <= len(subcategories):
                     subcategory = subcategories[subcategory_idx - 1]
                     break
@@ -218,31 +542,32 @@ class TimeTracker:
         total_seconds = timer_data.get('accumulated_seconds', 0.0)
 
         if not timer_data['paused']:
-            start_time = datetime.datetime.fromisoformat(timer_data['start_time'])
-            now = datetime.datetime.now()
+            start_time = datetime.fromisoformat(timer_data['start_time'])
+            now = datetime.now()
             elapsed = (now - start_time).total_seconds()
             total_seconds += elapsed
             end_time = now
         else:
-            end_time = datetime.datetime.fromisoformat(timer_data['pause_time'])
-            start_time = datetime.datetime.fromisoformat(timer_data.get('initial_start_time') or timer_data['pause_time'])
+            end_time = datetime.fromisoformat(timer_data['pause_time'])
+            start_time = datetime.fromisoformat(timer_data.get('initial_start_time') or timer_data['pause_time'])
         
-        duration = datetime.timedelta(seconds=total_seconds)
+        duration = timedelta(seconds=total_seconds)
 
         session = {
-            'id': len(self.sessions) + 1,
+            'id': self._new_session_id(),
             'main_category': timer_data['main_category'],
             'subcategory': timer_data['subcategory'],
             'description': timer_data['description'],
-            'start_time': start_time.isoformat(),
-            'end_time': end_time.isoformat(),
+            'start_time': start_time,
+            'end_time': end_time,
             'duration': str(duration),
             'duration_hours': total_seconds / 3600,
             'week': start_time.isocalendar()[1]
         }
 
-        self.sessions.append(session)
+        self._add_to_sessions(session)
         del self.active_timers[timer_key]
+        self._dirty = True
         self._save_data()
 
         hours, remainder = divmod(int(duration.total_seconds()), 3600)
@@ -255,14 +580,17 @@ class TimeTracker:
         if not self.sessions:
             raise click.ClickException("No sessions available to edit")
         
-        click.echo("\nAvailable sessions:")
-        for session in self.sessions:
-            click.echo(f"ID: {session['id']} - {session['main_category']} - {session['subcategory']} ({session['duration_hours']:.2f}h)")
+        lines = ["\nAvailable sessions:"]
+        lines.extend(
+            f"ID: {session['id']} - {session['main_category']} - {session['subcategory']} ({session['duration_hours']:.2f}h)"
+            for session in self.sessions
+        )
+        click.echo("\n".join(lines))
         
         while True:
             try:
-                session_id = click.prompt("Select session ID to edit", type=int)
-                if any(s['id'] == session_id for s in self.sessions):
+                session_id = _fast_prompt_int("Select session ID to edit")
+                if session_id in self._by_id:
                     return session_id
                 click.echo("Invalid session ID. Please try again.")
             except ValueError:
@@ -276,101 +604,109 @@ class TimeTracker:
 
     def edit_session(self, session_id: int, duration_hours: float):
         """Edit a session's duration."""
-        session = next((s for s in self.sessions if s['id'] == session_id), None)
+        session = self._by_id.get(session_id)
         if not session:
             raise click.ClickException(f"No session found with id {session_id}")
         
         # Update duration and related fields
         session['duration_hours'] = duration_hours
-        duration_delta = datetime.timedelta(hours=duration_hours)
+        duration_delta = timedelta(hours=duration_hours)
         session['duration'] = str(duration_delta)
         
-        # Convert start_time to datetime if it's a string
-        if isinstance(session['start_time'], str):
-            session['start_time'] = datetime.datetime.fromisoformat(session['start_time'])
-        
-        # Calculate new end time
+        # Calculate new end time, sessions hold datetimes since they are parsed on load
         session['end_time'] = session['start_time'] + duration_delta
         
+        self._pending_events.append({'op': 'edit', 'session': session})
         self._save_data()
         return session
 
     def remove_session(self, session_id: int) -> bool:
         """Remove a single session by ID."""
-        session = next((s for s in self.sessions if s['id'] == session_id), None)
-        if not session:
-            raise click.ClickException(f"No session found with id {session_id}")
-        
-        self.sessions.remove(session)
-        self._save_data()
+        self.remove_sessions([session_id])
         return True
 
+    def remove_sessions(self, session_ids: Iterable[int]) -> int:
+        """Remove sessions by ID in a single pass and return count of removed sessions."""
+        ids = set(session_ids)
+        missing = ids - self._by_id.keys()
+        if missing:
+            raise click.ClickException(f"No session found with id {', '.join(map(str, sorted(missing)))}")
+
+        self._remove_sessions_where(lambda s: s['id'] in ids)
+        return len(ids)
+
+    def _remove_sessions_where(self, should_remove) -> int:
+        """Remove the sessions matching should_remove, log it and return the count."""
+        sessions = self.sessions
+        removed_ids = [s['id'] for s in sessions if should_remove(s)]
+        if removed_ids:
+            gone = set(removed_ids)
+            # The first _saved_sessions sessions are the ones already on disk
+            self._saved_sessions -= sum(1 for s in sessions[:self._saved_sessions] if s['id'] in gone)
+            self.sessions = [s for s in sessions if s['id'] not in gone]
+            # The log must never see a removed id handed out again
+            self._cover_ids(max(removed_ids))
+            self._pending_events.append({'op': 'remove', 'ids': removed_ids})
+        self._save_data()
+        return len(removed_ids)
+
     def remove_all_sessions(self) -> int:
         """Remove all sessions and return count of removed sessions."""
         count = len(self.sessions)
+        # An empty list rewrites the sessions file instead of logging every id
         self.sessions = []
+        # An old data file may still hold an empty sessions list to drop
+        if count or 'sessions' in self._read_data_file():
+            self._dirty = True
         self._save_data()
         return count
 
-    def remove_sessions_by_date(self, target_date: datetime.date) -> int:
+    def remove_sessions_by_date(self, target_date: date) -> int:
         """Remove sessions for specific date."""
-        original_count = len(self.sessions)
-        self.sessions = [
-            s for s in self.sessions 
-            if datetime.datetime.fromisoformat(str(s['start_time'])).date() != target_date
-        ]
-        removed_count = original_count - len(self.sessions)
-        self._save_data()
-        return removed_count
+        return self._remove_sessions_where(lambda s: s['start_time'].date() == target_date)
 
     def remove_sessions_by_week(self, week_offset: int = 0) -> int:
         """Remove sessions for specific week."""
-        target_week = (datetime.datetime.now() + datetime.timedelta(weeks=week_offset)).isocalendar()[1]
-        original_count = len(self.sessions)
-        self.sessions = [s for s in self.sessions if s['week'] != target_week]
-        removed_count = original_count - len(self.sessions)
-        self._save_data()
-        return removed_count
+        target_week = (datetime.now() + timedelta(weeks=week_offset)).isocalendar()[1]
+        return self._remove_sessions_where(lambda s: s['week'] == target_week)
 
-    def add_session(self, date: datetime.datetime, duration_hours: float, main_category: str, subcategory: str, description: str = ""):
+    def add_session(self, date: datetime, duration_hours: float, main_category: str, subcategory: str, description: str = ""):
         """Add a new session directly."""
-        if not subcategory in self.get_subcategories(main_category):
-            valid_subcategories = "\n".join(f"- {sub}" for sub in self.get_subcategories(main_category))
-            raise click.ClickException(
-                f"Invalid subcategory! Valid subcategories for {main_category} are:\n{valid_subcategories}"
-            )
+        self._check_subcategory(main_category, subcategory)
         
         start_time = date
-        end_time = start_time + datetime.timedelta(hours=duration_hours)
+        end_time = start_time + timedelta(hours=duration_hours)
         
         session = {
-            'id': len(self.sessions) + 1,
+            'id': self._new_session_id(),
             'main_category': main_category,
             'subcategory': subcategory,
             'description': description,
             'start_time': start_time,
             'end_time': end_time,
-            'duration': str(datetime.timedelta(hours=duration_hours)),
+            'duration': str(timedelta(hours=duration_hours)),
             'duration_hours': duration_hours,
             'week': start_time.isocalendar()[1]
         }
         
-        self.sessions.append(session)
+        self._add_to_sessions(session)
+        self._dirty = True
         self._save_data()
         return session
 
     def add_session_wizard(self):
         """Interactive wizard for adding a new session."""
         # Get date with today as default
-        today = datetime.datetime.now().strftime("%Y-%m-%d")
+        now = datetime.now()
+        today = f"{now.year:04d}-{now.month:02d}-{now.day:02d}"
         date_str = click.prompt("Enter date (YYYY-MM-DD)", type=str, default=today)
         
         # Get time with current hour as default
-        current_time = datetime.datetime.now().strftime("%H:%M")
+        current_time = f"{now.hour:02d}:{now.minute:02d}"
         time_str = click.prompt("Enter time (HH:MM)", type=str, default=current_time)
         
         try:
-            date = datetime.datetime.strptime(f"{date_str} {time_str}", "%Y-%m-%d %H:%M")
+            date = datetime.strptime(f"{date_str} {time_str}", "%Y-%m-%d %H:%M")
         except ValueError:
             raise click.ClickException("Invalid date/time format")
         
@@ -402,92 +738,88 @@ class TimeTracker:
             self._generate_detailed_report(filtered_sessions)
 
     def _generate_cospend_report(self, sessions):
-        click.echo("\nCospend Time Tracking Report")
-        click.echo("-" * 50)
+        lines: List[str] = []
+        lines.append("\nCospend Time Tracking Report")
+        lines.append("-" * 50)
 
-        # Group sessions by date
-        sessions_by_date = {}
-        for session in sessions:
-            start_date = datetime.datetime.fromisoformat(str(session['start_time'])).date()
-            if start_date not in sessions_by_date:
-                sessions_by_date[start_date] = []
-            sessions_by_date[start_date].append(session)
+        # Sessions are stored roughly in time order, so this sort is close to
+        # linear and lets groupby bucket them by date in a single pass
+        ordered = sorted(sessions, key=lambda s: s['start_time'])
 
         # Print sessions by date in the specified format
-        for date, day_sessions in sorted(sessions_by_date.items()):
-            click.echo(f"\nDate: {date.strftime('%Y-%m-%d')}")
+        for date, day_sessions in groupby(ordered, key=lambda s: s['start_time'].date()):
+            lines.append(f"\nDate: {date.year:04d}-{date.month:02d}-{date.day:02d}")
             for session in day_sessions:
                 main_category = session['main_category']
                 subcategory = session['subcategory']
                 description = session['description']
                 duration_hours = session['duration_hours']
-                click.echo(f"{main_category} - {subcategory}: {description} ({duration_hours:.2f})")
-        click.echo("-" * 50)
-        
+                lines.append(f"{main_category} - {subcategory}: {description} ({duration_hours:.2f})")
+        lines.append("-" * 50)
+
+        click.echo("\n".join(lines))
+
     def _generate_detailed_report(self, sessions):
-        click.echo("\nDetailed Time Tracking Report")
-        click.echo("-" * 115)
-        click.echo(f"{'ID':<5} {'Category':<15} {'Subcategory':<29} {'Description':<30} {'Duration':<10} {'Date':<14} {'Week':<5}")
-        click.echo("-" * 115)
+        lines: List[str] = []
+        lines.append("\nDetailed Time Tracking Report")
+        lines.append("-" * 115)
+        lines.append(DETAILED_ROW_FMT.format(
+            id='ID', main='Category', sub='Subcategory', desc='Description', dur='Duration', date='Date', week='Week'))
+        lines.append("-" * 115)
 
         total_hours = 0.0
 
         for session in sessions:
-            start = datetime.datetime.fromisoformat(str(session['start_time']))
+            start = session['start_time']
             duration_hours = session['duration_hours']
             subcategory = session.get('subcategory') or ''  # Use empty string if subcategory is None or missing
             description = session['description']
-            week = datetime.datetime.fromisoformat(session['start_time']).isocalendar()[1]
+            week = session['week']
 
             total_hours += duration_hours
 
             if len(description) > 28:
                 description = description[:25] + '...'
 
+            lines.append(DETAILED_ROW_FMT.format(
+                id=session['id'], main=session['main_category'], sub=subcategory, desc=description,
+                dur=f'{duration_hours:.2f}h', date=start.date().isoformat(), week=week))
 
-            click.echo(
-                f"{session['id']:<5}"
-                f"{session['main_category']:<15} "
-                f"{subcategory:<30} "
-                f"{description:<30} "
-                f"{f'{duration_hours:.2f}h':<10} "
-                f"{start.strftime('%Y-%m-%d'):<15}"
-                f"{str(week):<5}"
-            )
+        lines.append("-" * 115)
+        lines.append(f"Total Hours: {total_hours:.3f}h")
 
-        click.echo("-" * 115)
-        click.echo(f"Total Hours: {total_hours:.3f}h")
+        click.echo("\n".join(lines))
 
     def _generate_summary_report(self, sessions):
-        click.echo("\nTime Tracking Summary")
-        click.echo("-" * 50)
+        lines: List[str] = []
+        lines.append("\nTime Tracking Summary")
+        lines.append("-" * 50)
         
-        # Group by main category
-        category_totals: Dict[str, float] = {}
-        subcategory_totals: Dict[str, Dict[str, float]] = {}
-
-        for session in sessions:
-            main_cat = session['main_category']
-            sub_cat = session['subcategory']
-            duration = session['duration_hours']
+        # One dict update per session, keyed by (main, sub). The few distinct
+        # pairs are then grouped by main category
+        pair_totals: Dict[tuple, float] = defaultdict(float)
+        for main_cat, sub_cat, hours in map(_summary_fields, sessions):
+            pair_totals[main_cat, sub_cat] += hours
 
-            category_totals[main_cat] = category_totals.get(main_cat, 0) + duration
-            
-            if main_cat not in subcategory_totals:
-                subcategory_totals[main_cat] = {}
-            subcategory_totals[main_cat][sub_cat] = subcategory_totals[main_cat].get(sub_cat, 0) + duration
+        subcategory_totals: Dict[str, Dict[str, float]] = defaultdict(dict)
+        for (main_cat, sub_cat), hours in pair_totals.items():
+            subcategory_totals[main_cat][sub_cat] = hours
+        category_totals = {main_cat: sum(subs.values()) for main_cat, subs in subcategory_totals.items()}
 
         # Print totals
         total_hours = sum(category_totals.values())
-        for main_cat in self.categories.keys():
-            if main_cat in category_totals:
-                click.echo(f"\n{main_cat}:")
-                for sub_cat, hours in subcategory_totals[main_cat].items():
-                    click.echo(f" - {sub_cat}: ({hours:.2f})")
-                click.echo(f"Total: ({category_totals[main_cat]:.2f})")
+        # Only visit the categories that have sessions, in the categories file order
+        order = self._category_order
+        for main_cat in sorted(category_totals, key=lambda c: order.get(c, len(order))):
+            lines.append(f"\n{main_cat}:")
+            for sub_cat, hours in subcategory_totals[main_cat].items():
+                lines.append(f" - {sub_cat}: ({hours:.2f})")
+            lines.append(f"Total: ({category_totals[main_cat]:.2f})")
 
-        click.echo("-" * 50)
-        click.echo(f"\nTotal Hours: {total_hours:.2f}")
+        lines.append("-" * 50)
+        lines.append(f"\nTotal Hours: {total_hours:.2f}")
+
+        click.echo("\n".join(lines))
 
 @click.group()
 @click.pass_context
@@ -527,7 +859,7 @@ def add(tracker, date, time, duration, main_category, subcategory, description):
     """Add a time tracking session. If no options provided, launches interactive wizard."""
     if all([date, time, duration, main_category, subcategory]):
         try:
-            datetime_obj = datetime.datetime.strptime(f"{date} {time}", "%Y-%m-%d %H:%M")
+            datetime_obj = datetime.strptime(f"{date} {time}", "%Y-%m-%d %H:%M")
         except ValueError:
             raise click.ClickException("Invalid date/time format")
         session = tracker.add_session(datetime_obj, duration, main_category, subcategory, description)
@@ -558,7 +890,7 @@ def edit(tracker, session_id, duration_hours):
     click.echo(f"Description: {session['description']}")
 
 @cli.command()
-@click.option('--id', type=int, help='Remove session by ID')
+@click.option('--id', type=int, multiple=True, help='Remove session by ID (repeat to remove several)')
 @click.option('--all', 'remove_all', is_flag=True, help='Remove all sessions')
 @click.option('--day', type=int, is_flag=False, flag_value=0, help='Remove sessions by day offset (0=today, -1=yesterday)')
 @click.option('--week', type=int, help='Remove sessions by week offset (0=this week, -1=last week)')
@@ -569,15 +901,15 @@ def remove(tracker, id, remove_all, day, week):
         raise click.ClickException("Please specify exactly one removal option")
 
     if id:
-        tracker.remove_session(id)
-        click.echo(f"Removed session {id}")
+        tracker.remove_sessions(id)
+        click.echo(f"Removed session {', '.join(map(str, id))}")
     
     elif remove_all:
         count = tracker.remove_all_sessions()
         click.echo(f"Removed all {count} sessions")
     
     elif day is not None:
-        target_date = datetime.datetime.now().date() + datetime.timedelta(days=day)
+        target_date = datetime.now().date() + timedelta(days=day)
         count = tracker.remove_sessions_by_date(target_date)
         click.echo(f"Removed {count} sessions from {target_date}")
     
@@ -585,6 +917,13 @@ def remove(tracker, id, remove_all, day, week):
         count = tracker.remove_sessions_by_week(week)
         click.echo(f"Removed {count} sessions from week offset {week}")
 
+@cli.command()
+@click.pass_obj
+def compact(tracker):
+    """Rewrite the sessions file without the logged edits and removals."""
+    count = tracker.compact_sessions()
+    click.echo(f"Compacted sessions file to {count} sessions")
+
 @cli.command()
 @click.option('--main-category', '-m', help='Main category to end timer for')
 @click.option('--subcategory', '-s', help='Subcategory to end timer for')
@@ -640,6 +979,7 @@ def status(tracker):
 
     click.echo("\nActive Timers:")
     click.echo("-" * 70)
+    now = time.time()
     for timer_key, timer_data in tracker.active_timers.items():
         accumulated = timer_data.get('accumulated_seconds', 0.0)
         description = f" - {timer_data['description']}" if timer_data['description'] else ""
@@ -648,10 +988,7 @@ def status(tracker):
             total_seconds = accumulated
             status = "Paused"
         else:
-            start_time = datetime.datetime.fromisoformat(timer_data['start_time'])
-            now = datetime.datetime.now()
-            elapsed = (now - start_time).total_seconds()
-            total_seconds = accumulated + elapsed
+            total_seconds = accumulated + _running_seconds(timer_data, now)
             status = "Running"
 
         hours, remainder = divmod(int(total_seconds), 3600)
@@ -660,17 +997,22 @@ def status(tracker):
 
 @cli.command()
 @click.argument('main_category', required=False)
+@click.option('--export', is_flag=True, help='Write the categories to ~/.timetrack_categories.json for editing')
 @click.pass_obj
-def categories(tracker, main_category):
+def categories(tracker, main_category, export):
     """List categories and subcategories.
     
     Without arguments: shows all main categories
     With main_category: shows subcategories for that category
+    With --export: writes the categories file to customize
     """
+    if export:
+        path = tracker.export_categories()
+        click.echo(f"Wrote categories to {path}")
+        return
+
     if main_category is None:
-        click.echo("\nAvailable categories:")
-        for category in tracker.categories.keys():
-            click.echo(f"- {category}")
+        click.echo(tracker._categories_block)
         return
         
     subcategories = tracker.get_subcategories(main_category)